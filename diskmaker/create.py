@@ -5,6 +5,30 @@ import matplotlib.pyplot as plt
 
 from . import logger
 
+
+def _markBodiesNumpy(nPts, nLarge, width):
+    """ mark which of nPts evenly spaced slots hold small and large bodies
+
+    each large body sits in the middle of its slot and replaces
+    width small bodies around it, the centre of slot i is
+    floor((i + 0.5) * nPts / nLarge) done in integer arithmetic
+
+    Returns
+    ----------
+    bodyKind: uint8 array
+        0 for an empty slot, 1 for a small body and 2 for a large body
+    """
+    bodyKind = np.ones(nPts, dtype=np.uint8)
+
+    centers = ((2 * np.arange(nLarge, dtype=np.intp) + 1) * nPts) // (2 * nLarge)
+    offsets = np.arange(width) - (width // 2)
+    kill = (centers[:, None] + offsets[None, :]).ravel()
+    np.clip(kill, 0, nPts - 1, out=kill)
+    bodyKind[kill] = 0
+    bodyKind[centers] = 2
+    return bodyKind
+
+
 def calcSemis(totalMass, smallMass, largeMass, nSmall, 
     inner, outer, alpha, returnFigure=False):
     """
@@ -57,47 +81,53 @@ def calcSemis(totalMass, smallMass, largeMass, nSmall,
     else:
         logger.info('{} missing mass'.format(missingMass))
 
-    # how many times more massive is large relative to small
-    massMultiplier = largeMass / smallMass
+    # how many times more massive is large relative to small,
+    # i.e. how many small bodies each large body replaces
+    massMultiplier = int(round(largeMass / smallMass))
+
+    # the number of slots if the disk were made only of small bodies
+    nPts = nSmall + (nLarge * massMultiplier)
 
     # convert from surface density to radius
     power = alpha * 0.5
 
     span = outer - inner
 
-    # calculate the initial positions using only small bodies
-    unidist = np.linspace(0, 1, nSmall + ((largeMass * nLarge) / smallMass))
-    powdist = unidist**(power)
-
-    spacings = (powdist * span) + inner
+    # calculate the initial positions using only small bodies,
+    # working in place on a single array
+    spacings = np.linspace(0, 1, nPts)
+    np.power(spacings, power, out=spacings)
+    spacings *= span
+    spacings += inner
 
     # we make the final disk by masking bodies
-    maskSmall = np.ones_like(spacings, dtype=bool)
-    maskLarge = np.zeros_like(spacings, dtype=bool)
+    bodyKind = _markBodiesNumpy(nPts, nLarge, massMultiplier)
 
-    pos = len(unidist) / nLarge 
-    for i in range(nLarge):
-        maskLarge[int((i*pos)+(0.5*pos))] = True
-        maskSmall[int((i*pos)+(0.5*pos)-(massMultiplier/2)):
-            int((i*pos)+(0.5*pos)+(massMultiplier/2))] = False
+    # spacings is monotonic so selecting the kept bodies leaves them sorted
+    keep = bodyKind != 0
+    finalSemi = spacings[keep]
+    isLarge = bodyKind[keep] == 2
 
-    idx = np.argsort(np.r_[spacings[maskLarge],spacings[maskSmall]])
-    finalSemi = np.r_[spacings[maskLarge],spacings[maskSmall]]
-    finalMass = np.r_[np.ones_like(spacings[maskLarge]) * largeMass, 
-        np.ones_like(spacings[maskSmall]) * smallMass]
+    finalMass = np.full(finalSemi.shape, smallMass, dtype=float)
+    finalMass[isLarge] = largeMass
 
-    bodyType = np.where(finalMass > smallMass, 'EM', 'PL')
+    bodyType = np.empty(finalSemi.shape, dtype='U2')
+    bodyType[:] = 'PL'
+    bodyType[isLarge] = 'EM'
 
     if returnFigure:
+        idxLarge = np.flatnonzero(bodyKind == 2)
+        idxSmall = np.flatnonzero(bodyKind == 1)
+
         fig, [ax1,ax2]  = plt.subplots(2, 1, figsize=[9,7])
-        ax1.scatter(np.arange(unidist.shape[0])[maskLarge],spacings[maskLarge],
+        ax1.scatter(idxLarge,spacings[idxLarge],
             s=300,color='r',alpha=0.5,edgecolors='k')
-        ax1.scatter(np.arange(unidist.shape[0])[maskSmall],spacings[maskSmall])
+        ax1.scatter(idxSmall,spacings[idxSmall])
         ax1.grid()
         ax1.set_xlabel('Body number')
         ax1.set_ylabel('Semimajor axis')
 
-        ax2.plot(finalSemi[idx],np.cumsum(finalMass[idx]), '.-')
+        ax2.plot(finalSemi,np.cumsum(finalMass), '.-')
 
         n = 1000
         npm = totalMass / n
@@ -108,10 +138,10 @@ def calcSemis(totalMass, smallMass, largeMass, nSmall,
         ax2.set_ylabel('Semimajor axis')
 
 
-        return finalSemi[idx], finalMass[idx], bodyType[idx], fig
+        return finalSemi, finalMass, bodyType, fig
 
 
-    return finalSemi[idx], finalMass[idx], bodyType[idx]
+    return finalSemi, finalMass, bodyType
 
 
 def calcMutualHill(a1, a2, m1, m2, mstar=1.0):
@@ -144,31 +174,40 @@ def calcMutualHill(a1, a2, m1, m2, mstar=1.0):
         ((m1_si + m2_si)/(3 * mstar_si))**(1/3)) / au2meter
     return mutualHill
 
-def drawEIOoM(size=1,**kwargs):
-    try:
-        ecc = kwargs['ecc']
-    except KeyError:
-        ecc = np.random.uniform(0,0.01, size=size)
+# lower and upper bounds of ecc, inc, littleOm, bigOm, meananom
+_eioomLow = np.array([0., 0., 0., 0., 0.])
+_eioomHigh = np.array([0.01, 0.5, 360., 360., 360.])
 
-    try:
-        inc = kwargs['inc']
-    except KeyError:
-        inc = np.random.uniform(0,0.5, size=size)
+def drawEIOoM(size=1, rng=None, **kwargs):
+    """ draw eccentricity, inclination, argument of pericentre,
+    longitude of ascending node and mean anomaly for a set of bodies
 
-    try:
-        littleOm = kwargs['littleOm']
-    except KeyError:
-        littleOm = np.random.uniform(0,360, size=size)
+    Parameters
+    ----------
+    size : int, optional
+        the number of bodies
+    rng : None, int or numpy Generator, optional
+        source of the random draws, passed to np.random.default_rng
+        so an int seed gives reproducible elements
+    ecc, inc, littleOm, bigOm, meananom : array, optional
+        values to use instead of drawing that element
 
-    try:
-        bigOm = kwargs['bigOm']
-    except KeyError:
-        bigOm = np.random.uniform(0,360, size=size)
+    Returns
+    ----------
+    ecc, inc, littleOm, bigOm, meananom: arrays
+        the orbital elements, angles in degrees
+    """
+    rng = np.random.default_rng(rng)
 
-    try:
-        meananom = kwargs['meananom']
-    except KeyError:
-        meananom = np.random.uniform(0,360, size=size)
+    # draw all five elements in one call, then override with any given
+    draws = rng.uniform(_eioomLow[:, None], _eioomHigh[:, None], 
+        size=(5, size))
+
+    ecc = kwargs.get('ecc', draws[0])
+    inc = kwargs.get('inc', draws[1])
+    littleOm = kwargs.get('littleOm', draws[2])
+    bigOm = kwargs.get('bigOm', draws[3])
+    meananom = kwargs.get('meananom', draws[4])
 
     return ecc, inc, littleOm, bigOm, meananom
 
@@ -188,17 +227,27 @@ epoch (in days) = 0.0
 """
     return headstr
 
+# a single body entry in a Mercury big.in file
+_bodyFormat = """ %s m=%.6e r=0.1 d=3
+  %.6e %.7e %.4e %.4e %.4e %.4e 0.0 0.0 0.0"""
+
 def writeBody(bodyname, mass, semimajor, 
     ecc, inc, littleOm, bigOm, meananom):
     """write out a line for a single body in format of Mercury big.in file
+
+    the entry has no trailing newline so entries can be joined with one
     """
-    bodystr= """ {} m={:.6e} r=0.1 d=3
-  {:.6e} {:.7e} {:.4e} {:.4e} {:.4e} {:.4e} 0.0 0.0 0.0
-""".format(bodyname, mass, semimajor, ecc, inc, littleOm, bigOm, meananom)
+    bodystr = _bodyFormat % (bodyname, mass, semimajor, 
+        ecc, inc, littleOm, bigOm, meananom)
     return bodystr
 
 def createBigin(totalMass, smallMass, largeMass, nSmall, 
-    inner, outer, alpha, ):
+    inner, outer, alpha, rng=None):
+    """ create the contents of a Mercury big.in file for a disk
+
+    the first seven parameters are as in calcSemis, rng is passed
+    to drawEIOoM, give an int seed for a reproducible file
+    """
     
     finalSemi, finalMass, bodyType = calcSemis(totalMass, smallMass, 
         largeMass, nSmall, inner, outer, alpha)
@@ -206,17 +255,19 @@ def createBigin(totalMass, smallMass, largeMass, nSmall,
     nbodies = finalSemi.shape[0]
     if nbodies > 9999:
         logger.error('Too many bodies, need to change code in name bodies')
-    ecc, inc, littleOm, bigOm, meananom = drawEIOoM(size=nbodies)
+    ecc, inc, littleOm, bigOm, meananom = drawEIOoM(size=nbodies, rng=rng)
 
-    outstr = writeHead()
     earthmass2sunmass = 3.003467e-6
-    for i,a in enumerate(finalSemi):
-        bodyname = bodyType[i] + '{:04}'.format(i)
-        outstr += writeBody(bodyname, finalMass[i]*earthmass2sunmass, finalSemi[i], 
-                        ecc[i], inc[i], littleOm[i], bigOm[i], meananom[i])
-    #remove the final blank line
-    outstr = outstr[:-1]
-    return outstr
+    massSun = finalMass * earthmass2sunmass
+
+    # body names are the type followed by a zero padded index
+    bodyNames = np.char.add(bodyType, 
+        np.char.zfill(np.arange(nbodies).astype(str), 4))
+
+    parts = [_bodyFormat % row for row in zip(bodyNames, massSun, finalSemi, 
+        ecc, inc, littleOm, bigOm, meananom)]
+    # newlines only between bodies so the file has no final blank line
+    return writeHead() + '\n'.join(parts)
 
 
 
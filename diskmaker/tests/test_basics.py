@@ -32,3 +32,67 @@ def test_create():
     assert np.abs((np.sum(finalMass) - totalmass)/totalmass) < 0.05
 
 
+def test_sorted():
+    """
+    are bodies returned in order of semimajor axis
+    """
+    from diskmaker.create import calcSemis
+    ###
+    totalmass = 5.0
+    smallmass = 0.01
+    largemass = 0.1
+    nsmallbodies = 260
+    inner = 0.2
+    outer = 4.0
+    alpha = 3./2.
+    #####
+
+    finalSemi, finalMass, bodyType = calcSemis(totalmass, smallmass, 
+        largemass, nsmallbodies, inner, outer, alpha)
+
+    assert np.all(np.diff(finalSemi) >= 0)
+    assert np.all((bodyType == 'EM') == (finalMass == largemass))
+
+
+def test_intmass():
+    """
+    are masses kept as floats when given integer inputs
+    """
+    from diskmaker.create import calcSemis
+
+    finalSemi, finalMass, bodyType = calcSemis(50, 1, 10.5, 20, 
+        0.2, 4.0, 1.5)
+
+    assert finalMass.dtype.kind == 'f'
+    assert np.all(finalMass[bodyType == 'EM'] == 10.5)
+
+
+def test_seed():
+    """
+    does seeding give a reproducible big.in file
+    """
+    from diskmaker.create import createBigin
+
+    args = (5.0, 0.01, 0.1, 200, 0.2, 4.0, 3./2.)
+    assert createBigin(*args, rng=42) == createBigin(*args, rng=42)
+    assert createBigin(*args, rng=42) != createBigin(*args, rng=43)
+
+
+def test_markbodies():
+    """
+    does the body masking match hand worked examples
+    """
+    from diskmaker.create import _markBodiesNumpy
+
+    # every slot is taken by a large body or cleared around one
+    assert np.all(_markBodiesNumpy(12, 3, 4) == 
+        [0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0])
+    assert np.all(_markBodiesNumpy(7, 7, 1) == [2, 2, 2, 2, 2, 2, 2])
+    assert np.all(_markBodiesNumpy(9, 1, 9) == 
+        [0, 0, 0, 0, 2, 0, 0, 0, 0])
+
+    # each large body replaces width small bodies
+    for nPts, nLarge, width in [(500, 30, 10), (340, 40, 5)]:
+        kind = _markBodiesNumpy(nPts, nLarge, width)
+        assert np.sum(kind == 2) == nLarge
+        assert np.sum(kind == 1) == nPts - (nLarge * width)
@@ -18,5 +18,5 @@ setup(name='diskmaker',
       author_email='tom@tombarclay.com',
       url='https://github.com/Worlds-Collide/disk-maker',
       packages=['diskmaker'],
-      install_requires=["numpy>=1.8"],
+      install_requires=["numpy>=1.17"],
       )
\ No newline at end of file